@@ -1,3 +1,4 @@
+import time
 from include.DebugHelper import DebugHelper
 from include.HTMLFetcher import HTMLFetcher
 from include.HTMLProductFinder import HTMLProductFinder
@@ -5,6 +6,7 @@ from include.NLPModel import NLPModel
 from include.ProductValidator import ProductValidator
 from include.StructuredDataExtractor import StructuredDataExtractor
 from include.ProductHelper import ProductHelper
+from include.ProductDataset import STATUS_BAD_REQUEST, STATUS_NO_PRODUCTS, STATUS_OK, make_product_record
 
 class FurnitureProductExtractor:
     def __init__(self, html_fetcher=None, product_finder=None, data_extractor=None):
@@ -48,3 +50,36 @@ class FurnitureProductExtractor:
         data = structured_data + unstructured_data
         self.product_helper.process(data)
         return data
+
+    def process_url_records(self, url, include_unstructured=False):
+        """Process URL into per-source product records for ProductDatasetWriter."""
+        DebugHelper().log(f"Processing URL records: {url}", self.__class__.__qualname__)
+        start_time = time.perf_counter()
+        soup = self.fetch_html(url)
+        fetch_time = time.perf_counter() - start_time
+        if not soup:
+            return [make_product_record(url, STATUS_BAD_REQUEST, fetch_time, 0.0)]
+
+        sources = self.data_extractor.structured_data_sources()
+        if include_unstructured:
+            sources["html"] = lambda soup, names: names.extend(self.extract_unstructured_data(soup))
+
+        found = []
+        for source, extract in sources.items():
+            DebugHelper().log(f"Processing {source} data for URL: {url}", self.__class__.__qualname__)
+            names = []
+            start_time = time.perf_counter()
+            extract(soup, names)
+            names = self.product_helper.process(names)
+            source_extract_time = time.perf_counter() - start_time
+            found.append((source, names, source_extract_time))
+
+        extract_time = sum(source_extract_time for _, _, source_extract_time in found)
+        records = [
+            make_product_record(url, STATUS_OK, fetch_time, extract_time, name, source, source_extract_time)
+            for source, names, source_extract_time in found
+            for name in names
+        ]
+        if not records:
+            return [make_product_record(url, STATUS_NO_PRODUCTS, fetch_time, extract_time)]
+        return records
@@ -0,0 +1,159 @@
+import csv
+import pyarrow as pa
+from include.DebugHelper import DebugHelper
+
+
+PRODUCT_DATASET_SCHEMA = pa.schema([
+    ("url", pa.string()),
+    ("name", pa.string()),
+    ("source", pa.string()),
+    ("status", pa.string()),
+    ("fetch_time", pa.float64()),
+    ("extract_time", pa.float64()),
+    ("source_extract_time", pa.float64()),
+])
+
+STATUS_OK = "ok"
+STATUS_BAD_REQUEST = "bad request"
+STATUS_NO_PRODUCTS = "no products"
+
+
+def make_product_record(url, status, fetch_time, extract_time, name=None, source=None, source_extract_time=None):
+    """
+    Build a single row of the product dataset.
+
+    Args:
+        url (str): The crawled URL.
+        status (str): STATUS_OK for product rows, STATUS_BAD_REQUEST or
+            STATUS_NO_PRODUCTS for the single placeholder row of a URL
+            without products.
+        fetch_time (float): Seconds spent downloading and parsing the page.
+        extract_time (float): Seconds spent across all extraction sources of the URL.
+        name (str): The product name, None for placeholder rows.
+        source (str): 'json-ld', 'microdata', 'rdfa' or 'html', None for placeholder rows.
+        source_extract_time (float): Seconds spent extracting and normalizing
+            names from this row's source, None for placeholder rows.
+
+    Returns:
+        dict: A record matching PRODUCT_DATASET_SCHEMA.
+    """
+    return {
+        "url": url,
+        "name": name,
+        "source": source,
+        "status": status,
+        "fetch_time": fetch_time,
+        "extract_time": extract_time,
+        "source_extract_time": source_extract_time,
+    }
+
+
+class ProductDatasetWriter:
+    """
+    Writes product records to an uncompressed Arrow IPC stream in batches,
+    so results are persisted while the crawl is still running and the file
+    stays readable up to the last batch written if the crawl is interrupted.
+    """
+    def __init__(self, path, batch_size=100):
+        DebugHelper().log(f"Opening product dataset {path}", self.__class__.__qualname__)
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_stream(self._sink, PRODUCT_DATASET_SCHEMA)
+        self._sink.flush()
+
+    def write(self, records):
+        """Buffer records and flush a batch once batch_size rows are pending."""
+        self._buffer.extend(records)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records as a single record batch."""
+        if not self._buffer:
+            return
+        DebugHelper().log(f"Writing {len(self._buffer)} records to {self.path}", self.__class__.__qualname__)
+        batch = pa.RecordBatch.from_pylist(self._buffer, schema=PRODUCT_DATASET_SCHEMA)
+        self._writer.write_batch(batch)
+        self._sink.flush()
+        self._buffer = []
+
+    def close(self):
+        """Flush remaining records and write the end-of-stream marker."""
+        self.flush()
+        self._writer.close()
+        self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ProductDatasetReader:
+    """
+    Reads a product dataset written by ProductDatasetWriter. The stream is
+    uncompressed, so the returned columns point straight into the
+    memory-mapped file instead of being copied onto the heap.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def read_table(self, columns=None):
+        """
+        Load the dataset as a pyarrow Table backed by a memory map.
+
+        Batches after an interrupted write are ignored, so a partially
+        written dataset can still be read.
+
+        Args:
+            columns (list): Optional subset of columns to select.
+
+        Returns:
+            pa.Table: The product records.
+        """
+        DebugHelper().log(f"Reading product dataset {self.path}", self.__class__.__qualname__)
+        batches = []
+        with pa.memory_map(self.path, "r") as source:
+            try:
+                for batch in pa.ipc.open_stream(source):
+                    batches.append(batch)
+            except (pa.ArrowInvalid, OSError) as e:
+                DebugHelper().log(f"Stopped reading truncated dataset {self.path}: {e}", self.__class__.__qualname__)
+        table = pa.Table.from_batches(batches, schema=PRODUCT_DATASET_SCHEMA)
+        return table.select(columns) if columns else table
+
+    def to_pandas(self, columns=None):
+        """Load the dataset as a pandas DataFrame."""
+        return self.read_table(columns).to_pandas()
+
+    def export_csv(self, path, product_helper=None):
+        """
+        Export the dataset in the legacy URL,Names CSV layout.
+
+        Product names are comma-joined per URL and URLs that could not be
+        fetched are skipped, matching the original clean_output.csv. Repeats
+        across sources are removed with product_helper.remove_duplicates when
+        a ProductHelper is given, otherwise only exact repeats are dropped.
+        """
+        DebugHelper().log(f"Exporting product dataset to {path}", self.__class__.__qualname__)
+        table = self.read_table(["url", "name", "status"])
+        names_by_url = {}
+        for url, name, status in zip(*(table.column(c).to_pylist() for c in ("url", "name", "status"))):
+            if status == STATUS_BAD_REQUEST:
+                continue
+            names = names_by_url.setdefault(url, [])
+            if name:
+                names.append(name)
+
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["URL", "Names"])
+            for url, names in names_by_url.items():
+                if product_helper:
+                    names = product_helper.remove_duplicates(names)
+                else:
+                    names = list(dict.fromkeys(names))
+                writer.writerow([url, ', '.join(names)])
@@ -67,6 +67,14 @@ class StructuredDataExtractor:
 
 
 
+    def structured_data_sources(self):
+        """Map each markup type to the method extracting product names from it."""
+        return {
+            "json-ld": self.extract_structured_product_data_json_ld,
+            "microdata": self.extract_structured_product_data_microdata,
+            "rdfa": self.extract_structured_product_data_rdfa,
+        }
+
     def extract_all_structured_data(self, soup):
         """Extract structured product data from schema.org markup"""
 
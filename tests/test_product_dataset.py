@@ -0,0 +1,103 @@
+import shutil
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+
+from include.ProductDataset import (
+    PRODUCT_DATASET_SCHEMA,
+    STATUS_BAD_REQUEST,
+    STATUS_NO_PRODUCTS,
+    STATUS_OK,
+    ProductDatasetReader,
+    ProductDatasetWriter,
+    make_product_record,
+)
+from include.ProductHelper import ProductHelper
+
+
+class FakeNLPModel:
+    """Splits on whitespace instead of running spaCy."""
+    def tokenize(self, text):
+        return [SimpleNamespace(lemma_=word, is_punct=False) for word in text.split()]
+
+
+RECORDS = [
+    make_product_record("https://a.com/p", STATUS_OK, 0.5, 0.3, "Sofa", "json-ld", 0.1),
+    make_product_record("https://a.com/p", STATUS_OK, 0.5, 0.3, "Sofa", "microdata", 0.1),
+    make_product_record("https://a.com/p", STATUS_OK, 0.5, 0.3, "SOFA", "html", 0.1),
+    make_product_record("https://a.com/p", STATUS_OK, 0.5, 0.3, "Café Chair", "html", 0.1),
+    make_product_record("https://b.com/p", STATUS_BAD_REQUEST, 3.0, 0.0),
+    make_product_record("https://c.com/p", STATUS_NO_PRODUCTS, 0.4, 0.2),
+]
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = tmp_path / "output.arrow"
+    with ProductDatasetWriter(str(path), batch_size=2) as writer:
+        for record in RECORDS:
+            writer.write([record])
+    return path
+
+
+def test_round_trip(dataset_path):
+    table = ProductDatasetReader(str(dataset_path)).read_table()
+    assert table.schema == PRODUCT_DATASET_SCHEMA
+    assert table.to_pylist() == RECORDS
+
+
+def test_read_table_does_not_copy(dataset_path):
+    before = pa.total_allocated_bytes()
+    table = ProductDatasetReader(str(dataset_path)).read_table()
+    assert table.num_rows == len(RECORDS)
+    assert pa.total_allocated_bytes() == before
+
+
+def test_read_table_columns(dataset_path):
+    table = ProductDatasetReader(str(dataset_path)).read_table(["url", "source"])
+    assert table.column_names == ["url", "source"]
+
+
+def test_export_csv_legacy_layout(dataset_path, tmp_path):
+    csv_path = tmp_path / "clean_output.csv"
+    product_helper = ProductHelper(FakeNLPModel())
+    ProductDatasetReader(str(dataset_path)).export_csv(str(csv_path), product_helper)
+    assert csv_path.read_bytes() == (
+        'URL,Names\n'
+        'https://a.com/p,"Sofa, Café Chair"\n'
+        'https://c.com/p,\n'
+    ).encode("utf-8")
+
+
+def test_export_csv_without_helper_drops_exact_repeats(dataset_path, tmp_path):
+    csv_path = tmp_path / "clean_output.csv"
+    ProductDatasetReader(str(dataset_path)).export_csv(str(csv_path))
+    assert csv_path.read_bytes().splitlines()[1] == 'https://a.com/p,"Sofa, SOFA, Café Chair"'.encode("utf-8")
+
+
+def test_read_truncated_stream(dataset_path, tmp_path):
+    truncated_path = tmp_path / "truncated.arrow"
+    truncated_path.write_bytes(dataset_path.read_bytes()[:-30])
+    table = ProductDatasetReader(str(truncated_path)).read_table()
+    assert table.to_pylist() == RECORDS[:4]
+
+
+def test_read_before_first_batch(tmp_path):
+    path = tmp_path / "output.arrow"
+    partial_path = tmp_path / "partial.arrow"
+    writer = ProductDatasetWriter(str(path), batch_size=100)
+    writer.write(RECORDS[:1])
+    shutil.copy(path, partial_path)
+    writer.close()
+    table = ProductDatasetReader(str(partial_path)).read_table()
+    assert table.num_rows == 0
+    assert table.schema == PRODUCT_DATASET_SCHEMA
+
+
+def test_read_empty_file(tmp_path):
+    path = tmp_path / "output.arrow"
+    path.write_bytes(b"")
+    table = ProductDatasetReader(str(path)).read_table()
+    assert table.num_rows == 0
+    assert table.schema == PRODUCT_DATASET_SCHEMA